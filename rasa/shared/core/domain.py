@@ -213,9 +213,9 @@ class Domain:
     def from_yaml(cls, yaml: Text, original_filename: Text = "") -> "Domain":
         """Loads the `Domain` from YAML text after validating it."""
         try:
-            rasa.shared.utils.validation.validate_yaml_schema(yaml, DOMAIN_SCHEMA_FILE)
-
-            data = rasa.shared.utils.io.read_yaml(yaml)
+            data = rasa.shared.utils.validation.validate_yaml_schema(
+                yaml, DOMAIN_SCHEMA_FILE
+            )
             if not rasa.shared.utils.validation.validate_training_data_format_version(
                 data, original_filename
             ):
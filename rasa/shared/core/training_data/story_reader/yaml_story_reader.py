@@ -129,10 +129,12 @@ class YAMLStoryReader(StoryReader):
         Returns:
             `StoryStep`s read from `string`.
         """
-        if not skip_validation:
-            rasa.shared.utils.validation.validate_yaml_schema(string, CORE_SCHEMA_FILE)
-
-        yaml_content = rasa.shared.utils.io.read_yaml(string)
+        if skip_validation:
+            yaml_content = rasa.shared.utils.io.read_yaml(string)
+        else:
+            yaml_content = rasa.shared.utils.validation.validate_yaml_schema(
+                string, CORE_SCHEMA_FILE
+            )
 
         return self.read_from_parsed_yaml(yaml_content)
 
@@ -58,13 +58,16 @@ class RasaYAMLReader(TrainingDataReader):
         self.lookup_tables: List[Dict[Text, Any]] = []
         self.responses: Dict[Text, List[Dict[Text, Any]]] = {}
 
-    def validate(self, string: Text) -> None:
+    def validate(self, string: Text) -> Any:
         """Check if the string adheres to the NLU yaml data schema.
 
         If the string is not in the right format, an exception will be raised.
+
+        Returns:
+            The parsed content of the string.
         """
         try:
-            validation.validate_yaml_schema(string, NLU_SCHEMA_FILE)
+            return validation.validate_yaml_schema(string, NLU_SCHEMA_FILE)
         except YamlException as e:
             e.filename = self.filename
             raise e
@@ -81,9 +84,7 @@ class RasaYAMLReader(TrainingDataReader):
         Returns:
             New `TrainingData` object with parsed training data.
         """
-        self.validate(string)
-
-        yaml_content = rasa.shared.utils.io.read_yaml(string)
+        yaml_content = self.validate(string)
 
         if not validation.validate_training_data_format_version(
             yaml_content, self.filename
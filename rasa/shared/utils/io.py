@@ -1,14 +1,16 @@
 from collections import OrderedDict
 import errno
+import functools
 import glob
 from hashlib import md5
 from io import StringIO
 import json
+import logging
 import os
 import sys
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Text, Type, Union
+from typing import Any, Dict, List, Optional, Pattern, Text, Tuple, Type, Union
 import warnings
 import random
 import string
@@ -33,6 +35,8 @@ from rasa.shared.exceptions import (
 )
 import rasa.shared.utils.validation
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_ENCODING = "utf-8"
 YAML_VERSION = (1, 2)
 
@@ -330,6 +334,25 @@ def replace_environment_variables() -> None:
     yaml.SafeConstructor.add_constructor("!env_var", env_var_constructor)
 
 
+@functools.lru_cache(maxsize=1)
+def check_yaml_c_extension() -> None:
+    """Logs a warning if the `libyaml` based parser of `ruamel.yaml` is unavailable.
+
+    The "safe" reader uses the C parser whenever `ruamel.yaml.clib` is installed.
+    Without it, parsing falls back to the pure Python implementation which is
+    considerably slower for large training data files. The check is only done
+    once per process.
+    """
+    from ruamel.yaml.main import CParser
+
+    if CParser is None:
+        logger.warning(
+            "The C extension of 'ruamel.yaml' is not available. YAML files will be "
+            "parsed with the pure Python parser which is considerably slower. "
+            "Install 'ruamel.yaml.clib' to speed up reading training data."
+        )
+
+
 fix_yaml_loader()
 replace_environment_variables()
 
@@ -344,8 +367,12 @@ def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> A
     Raises:
         ruamel.yaml.parser.ParserError: If there was an error when parsing the YAML.
     """
-    if _is_ascii(content):
-        # Required to make sure emojis are correctly parsed
+    check_yaml_c_extension()
+
+    if _is_ascii(content) and "\\" in content:
+        # Required to make sure emojis are correctly parsed. Without any backslash
+        # there are no escape sequences and the conversion would only copy the
+        # content several times without changing it.
         content = (
             content.encode("utf-8")
             .decode("raw_unicode_escape")
@@ -361,7 +388,7 @@ def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> A
 
 
 def _is_ascii(text: Text) -> bool:
-    return all(ord(character) < 128 for character in text)
+    return text.isascii()
 
 
 def read_yaml_file(
@@ -436,16 +463,24 @@ def is_key_in_yaml(file_path: Union[Text, Path], *keys: Text) -> bool:
         FileNotFoundException: if the file cannot be found.
     """
     try:
-        with open(file_path, encoding=DEFAULT_ENCODING) as file:
-            return any(
-                any(line.lstrip().startswith(f"{key}:") for key in keys)
-                for line in file
-            )
+        with open(file_path, "rb") as file:
+            content = file.read()
     except FileNotFoundError:
         raise FileNotFoundException(
             f"Failed to read file, " f"'{os.path.abspath(file_path)}' does not exist."
         )
 
+    return _yaml_key_pattern(keys).search(content) is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _yaml_key_pattern(keys: Tuple[Text, ...]) -> Pattern[bytes]:
+    """Compiles a pattern matching any of the keys at the start of a line."""
+    alternatives = b"|".join(re.escape(key.encode(DEFAULT_ENCODING)) for key in keys)
+    # leading whitespace must not span line breaks, otherwise runs of blank lines
+    # are backtracked from every line start which makes matching quadratic
+    return re.compile(rb"^[^\S\n]*(?:" + alternatives + rb"):", re.MULTILINE)
+
 
 def convert_to_ordered_dict(obj: Any) -> Any:
     """Convert object to an `OrderedDict`.
@@ -576,7 +611,9 @@ def read_validated_yaml(
     """
     content = read_file(filename)
 
-    rasa.shared.utils.validation.validate_yaml_schema(content, schema)
+    parsed_content = rasa.shared.utils.validation.validate_yaml_schema(content, schema)
+    if reader_type == "safe":
+        return parsed_content
     return read_yaml(content, reader_type)
 
 
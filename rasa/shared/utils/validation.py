@@ -1,3 +1,5 @@
+import functools
+import json
 import logging
 import os
 from typing import Text, Dict, List, Optional, Any
@@ -27,6 +29,11 @@ logger = logging.getLogger(__name__)
 
 KEY_TRAINING_DATA_FORMAT_VERSION = "version"
 
+# compiled `jsonschema` validators keyed by their serialized schema. Building a
+# validator runs `check_schema` against the metaschema which is expensive compared
+# to the actual validation of small instances (e.g. a single entity annotation).
+_JSON_SCHEMA_VALIDATORS: Dict[Text, Any] = {}
+
 
 class YamlValidationException(YamlException, ValueError):
     """Raised if a yaml file does not correspond to the expected schema."""
@@ -119,7 +126,7 @@ class YamlValidationException(YamlException, ValueError):
 
 def validate_yaml_schema(
     yaml_file_content: Text, schema_path: Text, package_name: Text = PACKAGE_NAME
-) -> None:
+) -> Any:
     """Validate yaml content.
 
     Args:
@@ -127,6 +134,10 @@ def validate_yaml_schema(
         schema_path: the schema of the yaml file
         package_name: the name of the package the schema is located in. defaults
             to `rasa`.
+
+    Returns:
+        The content parsed with the "safe" reader so that callers don't have to
+        parse the same content a second time.
     """
     from pykwalify.core import Core
     from pykwalify.errors import SchemaError
@@ -138,31 +149,24 @@ def validate_yaml_schema(
     log.setLevel(logging.CRITICAL)
 
     try:
-        # we need "rt" since
-        # it will add meta information to the parsed output. this meta information
-        # will include e.g. at which line an object was parsed. this is very
-        # helpful when we validate files later on and want to point the user to the
-        # right line
-        source_data = rasa.shared.utils.io.read_yaml(
-            yaml_file_content, reader_type=["safe", "rt"]
-        )
+        source_data = rasa.shared.utils.io.read_yaml(yaml_file_content)
     except (YAMLError, DuplicateKeyError) as e:
+        # the "safe" reader raises e.g. duplicate key errors before it constructed
+        # the values, which makes the error message misleading. The "rt" reader
+        # reports the full values, so we re-parse broken files with it.
+        try:
+            rasa.shared.utils.io.read_yaml(
+                yaml_file_content, reader_type=["safe", "rt"]
+            )
+        except (YAMLError, DuplicateKeyError) as round_trip_error:
+            raise YamlSyntaxException(underlying_yaml_exception=round_trip_error)
         raise YamlSyntaxException(underlying_yaml_exception=e)
 
-    schema_file = pkg_resources.resource_filename(package_name, schema_path)
-    schema_utils_file = pkg_resources.resource_filename(
-        PACKAGE_NAME, RESPONSES_SCHEMA_FILE
-    )
+    schema_content = _load_yaml_schema(schema_path, package_name)
     schema_extensions = pkg_resources.resource_filename(
         PACKAGE_NAME, SCHEMA_EXTENSIONS_FILE
     )
 
-    # Load schema content using our YAML loader as `pykwalify` uses a global instance
-    # which can fail when used concurrently
-    schema_content = rasa.shared.utils.io.read_yaml_file(schema_file)
-    schema_utils_content = rasa.shared.utils.io.read_yaml_file(schema_utils_file)
-    schema_content = dict(schema_content, **schema_utils_content)
-
     c = Core(
         source_data=source_data,
         schema_data=schema_content,
@@ -172,14 +176,56 @@ def validate_yaml_schema(
     try:
         c.validate(raise_exception=True)
     except SchemaError:
+        # we need "rt" since
+        # it will add meta information to the parsed output. this meta information
+        # will include e.g. at which line an object was parsed. this is very
+        # helpful to point the user to the right line. As this is only needed for
+        # the error message, the slower "rt" parsing is only done for invalid files.
+        content_with_line_numbers = rasa.shared.utils.io.read_yaml(
+            yaml_file_content, reader_type=["safe", "rt"]
+        )
         raise YamlValidationException(
             "Please make sure the file is correct and all "
             "mandatory parameters are specified. Here are the errors "
             "found during validation",
             c.errors,
-            content=source_data,
+            content=content_with_line_numbers,
         )
 
+    # `pykwalify` validates `source_data` in place and fills in `default:` values of
+    # the schema rules. The schemas therefore must not use `default:` as these
+    # values would leak into the parsed training data returned here.
+    return source_data
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_schema(schema_path: Text, package_name: Text) -> Dict[Text, Any]:
+    """Loads a `pykwalify` schema together with the shared responses schema.
+
+    The result is cached so that validating many training data files only reads
+    and parses the schema files once. The returned schema must not be modified
+    and must not contain `default:` rules (see `validate_yaml_schema`).
+
+    Args:
+        schema_path: the schema of the yaml file
+        package_name: the name of the package the schema is located in
+
+    Returns:
+        The merged schema content.
+    """
+    import pkg_resources
+
+    schema_file = pkg_resources.resource_filename(package_name, schema_path)
+    schema_utils_file = pkg_resources.resource_filename(
+        PACKAGE_NAME, RESPONSES_SCHEMA_FILE
+    )
+
+    # Load schema content using our YAML loader as `pykwalify` uses a global instance
+    # which can fail when used concurrently
+    schema_content = rasa.shared.utils.io.read_yaml_file(schema_file)
+    schema_utils_content = rasa.shared.utils.io.read_yaml_file(schema_utils_file)
+    return dict(schema_content, **schema_utils_content)
+
 
 def validate_training_data(json_data: Dict[Text, Any], schema: Dict[Text, Any]) -> None:
     """Validate rasa training data format to ensure proper training.
@@ -191,18 +237,45 @@ def validate_training_data(json_data: Dict[Text, Any], schema: Dict[Text, Any])
     Raises:
         SchemaValidationError if validation fails.
     """
-    from jsonschema import validate
-    from jsonschema import ValidationError
+    from jsonschema.exceptions import best_match
+
+    validator = _get_json_schema_validator(schema)
+    # stop at the first failing subtree instead of collecting every error of the
+    # instance. This means the reported error is the first one found in schema
+    # order rather than the most relevant one of all errors; `best_match` only
+    # picks the most relevant error within that first subtree (e.g. of a `oneOf`)
+    first_error = next(iter(validator.iter_errors(json_data)), None)
+    if first_error is None:
+        return
+
+    error = best_match([first_error])
+    error.message += (
+        f". Failed to validate data, make sure your data "
+        f"is valid. For more information about the format visit "
+        f"{DOCS_URL_TRAINING_DATA}."
+    )
+    raise SchemaValidationError.create_from(error) from error
 
-    try:
-        validate(json_data, schema)
-    except ValidationError as e:
-        e.message += (
-            f". Failed to validate data, make sure your data "
-            f"is valid. For more information about the format visit "
-            f"{DOCS_URL_TRAINING_DATA}."
-        )
-        raise SchemaValidationError.create_from(e) from e
+
+def _get_json_schema_validator(schema: Dict[Text, Any]) -> Any:
+    """Returns a validator for the schema which is compiled only once per process.
+
+    Args:
+        schema: the schema
+
+    Returns:
+        A `jsonschema` validator instance for the schema.
+    """
+    from jsonschema.validators import validator_for
+
+    key = json.dumps(schema, sort_keys=True)
+    validator = _JSON_SCHEMA_VALIDATORS.get(key)
+    if validator is None:
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        _JSON_SCHEMA_VALIDATORS[key] = validator
+    return validator
 
 
 def validate_training_data_format_version(
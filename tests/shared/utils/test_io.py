@@ -1,4 +1,5 @@
 import builtins
+import logging
 import sys
 import os
 import string
@@ -582,6 +583,25 @@ async def test_is_key_in_yaml(file: Text, keys: List[Text], expected_result: boo
     assert rasa.shared.utils.io.is_key_in_yaml(file, *keys) == expected_result
 
 
+@pytest.mark.parametrize(
+    "content,keys,expected_result",
+    [
+        ("\n" * 40000 + "stories:\n", ["stories", "rules"], True),
+        ("    \n" * 40000, ["stories", "rules"], False),
+        ("  stories:\n  - story: greet\n", ["stories"], True),
+        ('version: "3.1"\r\n\r\nrules:\r\n- rule: greet\r\n', ["rules"], True),
+        ("# stories:\nnlu:\n", ["stories"], False),
+    ],
+)
+def test_is_key_in_yaml_with_content(
+    tmp_path: Path, content: Text, keys: List[Text], expected_result: bool
+):
+    file = tmp_path / "data.yml"
+    file.write_bytes(content.encode(rasa.shared.utils.io.DEFAULT_ENCODING))
+
+    assert rasa.shared.utils.io.is_key_in_yaml(file, *keys) == expected_result
+
+
 async def test_is_key_in_yaml_with_unicode_files():
     # This shouldn't raise
     assert rasa.shared.utils.io.is_key_in_yaml(
@@ -664,3 +684,18 @@ def test_handle_print_blocking_windows(monkeypatch: MonkeyPatch):
 
     assert isinstance(mock_print.call_args[1]["file"], ansitowin32.StreamWrapper)
     assert mock_print.call_args[1]["flush"]
+
+
+def test_check_yaml_c_extension_warns_without_c_parser(
+    monkeypatch: MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    import ruamel.yaml.main
+
+    monkeypatch.setattr(ruamel.yaml.main, "CParser", None)
+    rasa.shared.utils.io.check_yaml_c_extension.cache_clear()
+
+    with caplog.at_level(logging.WARNING):
+        rasa.shared.utils.io.check_yaml_c_extension()
+
+    rasa.shared.utils.io.check_yaml_c_extension.cache_clear()
+    assert "C extension of 'ruamel.yaml' is not available" in caplog.text
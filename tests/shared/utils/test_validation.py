@@ -1,11 +1,15 @@
-from typing import Text
+from typing import Any, Dict, List, Text
 from threading import Thread
 
 import pytest
 
 from pep440_version_utils import Version
 
-from rasa.shared.exceptions import YamlException, SchemaValidationError
+from rasa.shared.exceptions import (
+    YamlException,
+    YamlSyntaxException,
+    SchemaValidationError,
+)
 import rasa.shared.utils.io
 import rasa.shared.utils.validation as validation_utils
 import rasa.utils.io as io_utils
@@ -33,6 +37,28 @@ def test_validate_yaml_schema(file, schema):
     validation_utils.validate_yaml_schema(rasa.shared.utils.io.read_file(file), schema)
 
 
+def test_validate_yaml_schema_returns_parsed_content():
+    content = rasa.shared.utils.io.read_file("data/test_moodbot/domain.yml")
+
+    parsed_content = validation_utils.validate_yaml_schema(content, DOMAIN_SCHEMA_FILE)
+
+    assert parsed_content == rasa.shared.utils.io.read_yaml(content)
+
+
+def test_validate_yaml_schema_reports_values_of_duplicate_keys():
+    content = rasa.shared.utils.io.read_file(
+        "data/test_domains/duplicate_responses.yml"
+    )
+
+    with pytest.raises(YamlSyntaxException) as e:
+        validation_utils.validate_yaml_schema(content, DOMAIN_SCHEMA_FILE)
+
+    assert (
+        'found duplicate key "utter_greet" with value '
+        "\"[ordereddict([('text', 'hey there!')])]\"" in str(e.value)
+    )
+
+
 def test_validate_yaml_schema_with_package_name():
     # should raise no exception
     file = "data/test_moodbot/domain.yml"
@@ -53,6 +79,13 @@ def test_validate_yaml_schema_with_random_package_name_fails():
         )
 
 
+def test_yaml_schema_is_loaded_once():
+    first = validation_utils._load_yaml_schema(DOMAIN_SCHEMA_FILE, "rasa")
+    second = validation_utils._load_yaml_schema(DOMAIN_SCHEMA_FILE, "rasa")
+
+    assert first is second
+
+
 @pytest.mark.parametrize(
     "file, schema",
     [
@@ -294,6 +327,39 @@ def test_entity_dict_is_valid(data):
     validation_utils.validate_training_data(data, schema.entity_dict_schema())
 
 
+@pytest.mark.parametrize(
+    "invalid_data, data_schema, expected_path",
+    [
+        ({"role": 1}, schema.entity_dict_schema(), ["role"]),
+        (
+            {
+                "rasa_nlu_data": {
+                    "regex_features": [{"name": 1}],
+                    "common_examples": "x",
+                }
+            },
+            schema.rasa_nlu_data_schema(),
+            ["rasa_nlu_data", "regex_features", 0, "name"],
+        ),
+    ],
+)
+def test_validate_training_data_reports_first_error(
+    invalid_data: Any, data_schema: Dict[Text, Any], expected_path: List[Any]
+):
+    with pytest.raises(SchemaValidationError) as e:
+        validation_utils.validate_training_data(invalid_data, data_schema)
+
+    assert list(e.value.path) == expected_path
+    assert e.value.message.startswith("1 is not of type 'string'")
+
+
+def test_json_schema_validator_is_compiled_once():
+    first = validation_utils._get_json_schema_validator(schema.entity_dict_schema())
+    second = validation_utils._get_json_schema_validator(schema.entity_dict_schema())
+
+    assert first is second
+
+
 async def test_future_training_data_format_version_not_compatible():
 
     next_minor = str(Version(LATEST_TRAINING_DATA_FORMAT_VERSION).next_minor())